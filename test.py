@@ -1,3 +1,5 @@
+import os
+
 import requests
 
 
@@ -6,21 +8,45 @@ def print_hi(name):
     print(f'Hi, {name}')  # Press Ctrl+F8 to toggle the breakpoint.
 
 
-def get_iptv_playlist(url):
+def download_iptv_playlist(url, file_path):
+    etag_path = file_path + ".etag"
+    headers = {}
+    # Only re-download if the server's copy changed since the last run
+    if os.path.isfile(file_path) and os.path.isfile(etag_path):
+        with open(etag_path, "r", encoding="utf-8") as file:
+            headers["If-None-Match"] = file.read().strip()
     try:
-        response = requests.get(url)
-        response.raise_for_status()  # Raise an error for bad responses
-        return response.text
+        # Stream the body straight to disk instead of holding it in memory
+        with requests.get(url, stream=True, headers=headers, timeout=10) as response:
+            if response.status_code == 304:
+                return True  # Saved playlist is still current
+            response.raise_for_status()  # Raise an error for bad responses
+            # Write to a temp file so a failed download keeps the last good copy
+            part_path = file_path + ".part"
+            try:
+                with open(part_path, "wb") as file:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        file.write(chunk)
+            except BaseException:
+                if os.path.isfile(part_path):
+                    os.remove(part_path)
+                raise
+            os.replace(part_path, file_path)
+            etag = response.headers.get("ETag")
+        # Only update the ETag once the new playlist is in place
+        if etag:
+            with open(etag_path, "w", encoding="utf-8") as file:
+                file.write(etag)
+        elif os.path.isfile(etag_path):
+            os.remove(etag_path)
+        return True
     except requests.exceptions.RequestException as e:
         print(f"Error fetching the IPTV playlist: {e}")
-        return None
+        return False
 
 
 # Press the green button in the gutter to run the script.
 if __name__ == '__main__':
     iptv_url = "Your link here"
     # response = requests.get(url)
-    playlist = get_iptv_playlist(iptv_url)
-    if playlist:
-        with open("request-answer.txt", "w", encoding="utf-8") as file:
-            file.write(playlist)
+    download_iptv_playlist(iptv_url, "request-answer.txt")